@@ -2,44 +2,105 @@
 """
 Ayla CLI - Une interface en ligne de commande avancé
 """
+import argparse
 import asyncio
+import signal
 import sys
 
-from src.cli import AylaCli
-
 try:
-    from anthropic import Anthropic, RateLimitError, APIStatusError, APIConnectionError, APIError
-    from rich.console import Console
-    from rich.markdown import Markdown
-    from rich.syntax import Syntax
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.theme import Theme
-    from rich import box
-    import nest_asyncio
+    import uvloop
 except ImportError:
-    print("Installation des dépendances requises...")
-    import subprocess
-
-    subprocess.check_call([sys.executable, "-m", "pip", "install",
-                           "anthropic", "rich", "nest_asyncio"])
-    from anthropic import Anthropic, RateLimitError, APIStatusError, APIConnectionError, APIError
-    from rich.console import Console
-    from rich.markdown import Markdown
-    from rich.syntax import Syntax
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.theme import Theme
-    from rich import box
-    import nest_asyncio
+    uvloop = None
+
+
+def _fast_path(argv) -> bool:
+    """
+    Traite --help, --version, --models et --list sans construire AylaCli.
+
+    Returns :
+        bool : True si la commande a été traitée
+    """
+    if any(arg in ("-h", "--help") for arg in argv):
+        from src.config.config import AylaConfig
+        from src.core.setup import AylaSetupAssistant
+
+        # Affiche l'aide et quitte, sauf si -h n'est en fait qu'une valeur d'option
+        AylaSetupAssistant.setup_argparse(AylaConfig(), argv).parse_args(argv)
+        return False
+
+    # Laisser le setup (prioritaire sur ces options) au parseur complet
+    if "--setup" in argv:
+        return False
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--version", "-v", action="store_true")
+    parser.add_argument("--models", action="store_true")
+    parser.add_argument("--list", "-l", action="store_true")
+    args, rest = parser.parse_known_args(argv)
+
+    # Tout autre argument est validé (ou rejeté) par le parseur complet
+    if rest or not (args.version or args.models or args.list):
+        return False
+
+    from src.config.config import AylaConfig
+    from src.core.ui import UI
+
+    ui = UI()
+    config = AylaConfig()
+
+    if args.version:
+        ui.print_info(f"Ayla CLI v-{config.get_version()}")
+    elif args.models:
+        ui.show_models_info(config.AVAILABLE_MODELS)
+    else:
+        from src.core.modules.conversation import ConversationManager
+        ui.show_conversations_list(ConversationManager(config, ui).list_conversations())
+    return True
 
 
 async def main():
     """Point d'entrée de l'application"""
+    loop = asyncio.get_running_loop()
+
+    # Exécuter les tâches immédiatement jusqu'à leur première suspension (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    app_task = None
+
+    def handle_sigint(signum, frame):
+        """Gère l'interruption par CTRL+C"""
+        if app_task is not None and asyncio.current_task(loop) is None:
+            # La boucle attend des E/S : annuler proprement la tâche en cours
+            app_task.cancel()
+            loop.call_soon_threadsafe(lambda: None)
+        else:
+            # Code bloquant en cours (saisie utilisateur...) : l'interrompre
+            raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, handle_sigint)
+
+    from src.cli import AylaCli
     app = AylaCli()
-    await app.run()
+    app_task = asyncio.create_task(app.run())
+    try:
+        await app_task
+    except asyncio.CancelledError:
+        # Annulation due à une sortie (argparse, sys.exit...) et non à CTRL+C
+        if not app_task.cancelled():
+            raise
+        app.ui.print_warning("\nOpération annulée par l'utilisateur.")
 
 if __name__ == "__main__":
+    if _fast_path(sys.argv[1:]):
+        sys.exit(0)
+
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    asyncio.run(main())
\ No newline at end of file
+    elif uvloop is not None:
+        # Boucle libuv plus rapide, non disponible sous Windows
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        sys.stderr.write("\nOpération annulée par l'utilisateur.\n")
\ No newline at end of file
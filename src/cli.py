@@ -1,71 +1,73 @@
+import importlib
+import importlib.util
 import os
-import signal
-import sys
-
-from anthropic import (
-    Anthropic
-)
-from rich.console import Console
-
-from src.core.handler.analyze_patterns import AnalyzePatterns
-from src.core.handler.analyze_project import AnalyzeProjectHandler
-from src.core.handler.analyze_project_patterns import AnalyzeProjectPatterns
-from src.core.handler.code_analyzer import CodeAnalyzerHandler
-from src.core.handler.documentation_generator import DocumentationGeneratorHandler
-from src.core.handler.process_git_handler import ProcessGitHandler
-from src.services.client import AnthropicClient
-from src.core.modules.code_analysis import CodeAnalyzer, PatternAnalyzer
+from functools import cached_property
+
 from src.config.config import AylaConfig
-from src.core.modules.conversation import ConversationManager
-from src.core.modules.file_manager import FileManager
-from src.core.modules.git_manager import GitManager
+from src.core.handler.base_handler import HandlerContext
 from src.core.setup import AylaSetupAssistant
-from src.core.streamer import ResponseStreamer
-from src.services.process_request import ProcessRequest
 from src.core.ui import UI
-from src.core.modules.crew_manager import CrewManager
+
+# Options argparse déclenchant une commande Git
+_GIT_COMMANDS = frozenset({
+    'git_commit', 'git_branch', 'git_analyze', 'git_diff_analyze',
+    'git_conventional_commit', 'git_create_branch', 'git_commit_and_push',
+    'git_stash', 'git_stash_apply', 'git_merge', 'git_merge_squash',
+    'git_log', 'git_visualize', 'git_conflict_assist', 'git_retrospective'
+})
+
+# Options argparse déclenchant une analyse de code, par ordre de priorité
+_ANALYSIS_COMMANDS = ('analyze', 'document', 'project', 'patterns_analyze', 'project_patterns')
+
+# Analyses utilisant le PatternAnalyzer fourni par le contexte
+_PATTERN_COMMANDS = frozenset({'patterns_analyze', 'project_patterns'})
+
+# Handlers utilisant le CrewManager (import coûteux de crewai et langchain)
+_CREW_COMMANDS = frozenset({'analyze', 'document', 'project', 'patterns_analyze'})
+
+# Handlers importés à la demande : commande (option argparse) -> (module, classe)
+_HANDLER_MODULES = {
+    'git': ('src.core.handler.process_git_handler', 'ProcessGitHandler'),
+    'analyze': ('src.core.handler.code_analyzer', 'CodeAnalyzerHandler'),
+    'document': ('src.core.handler.documentation_generator', 'DocumentationGeneratorHandler'),
+    'project': ('src.core.handler.analyze_project', 'AnalyzeProjectHandler'),
+    'patterns_analyze': ('src.core.handler.analyze_patterns', 'AnalyzePatterns'),
+    'project_patterns': ('src.core.handler.analyze_project_patterns', 'AnalyzeProjectPatterns'),
+}
+
+
+def _load_handler(command: str):
+    """Importe et retourne la classe de handler associée à une commande"""
+    module_name, class_name = _HANDLER_MODULES[command]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class AylaCli:
     """Classe principale de l'application"""
 
-    def __init__(self):
-        """Initialise l'application"""
-        signal.signal(signal.SIGINT, self._handle_sigint)
+    # Commandes utilitaires : option argparse -> méthode, par ordre de priorité
+    _UTILITY_COMMANDS = (
+        ('version', '_show_version'),
+        ('setup', '_run_setup'),
+        ('models', '_show_models'),
+        ('list', '_show_conversations'),
+    )
 
-        # Vérifier si l'analyse de code est disponible
-        try:
-            import tree_sitter
-            self.code_analysis_available = True
-        except ImportError:
-            self.code_analysis_available = False
+    # Disponibilité de tree-sitter, vérifiée une seule fois par processus
+    _code_analysis_available = None
 
-        # Initialiser les composants
+    def __init__(self):
+        """Initialise l'application"""
+        # Initialiser les composants (une seule console Rich partagée)
         self.ui = UI()
+        self.console = self.ui.console
         self.config = AylaConfig()
-        self.conv_manager = ConversationManager(self.config, self.ui)
-        self.file_manager = FileManager(self.ui)
-        self.streamer = ResponseStreamer(self.ui)
-        self.git_manager = GitManager(self.ui)
-        
-        # Initialiser le dépôt Git avec le répertoire courant
-        self.git_manager.set_repo_path(os.getcwd())
-        
-        self.console = Console()
-        self.client = Anthropic()
-        self.crew_manager = CrewManager(
-            model=self.config.DEFAULT_MODEL
-        )
-
-        # Initialiser le gestionnaire d'analyse de code si disponible
-        if self.code_analysis_available:
-            os.makedirs(
-                self.config.DEFAULT_ANALYSIS_DIR,
-                exist_ok=True
-            )
-            # Sera initialisé après l'obtention de la clé API
-            self.code_analyzer = None
-            self.pattern_analyzer = None
+
+        # Les gestionnaires (conversations, fichiers, Git, CrewAI...) sont créés
+        # à la première utilisation, voir les propriétés ci-dessous
+
+        # Analyseur de patterns, initialisé uniquement si une analyse de patterns est demandée
+        self.pattern_analyzer = None
 
         # Client sera initialisé plus tard avec la clé API
         self.client = None
@@ -73,10 +75,49 @@ class AylaCli:
         # Créer le parseur d'arguments
         self.parser = AylaSetupAssistant.setup_argparse(self.config)
 
-    def _handle_sigint(self, signal, frame):
-        """Gère l'interruption par CTRL+C"""
-        self.ui.print_warning("\nOpération annulée par l'utilisateur.")
-        sys.exit(0)
+    @cached_property
+    def conv_manager(self):
+        """Gestionnaire des conversations"""
+        from src.core.modules.conversation import ConversationManager
+        return ConversationManager(self.config, self.ui)
+
+    @cached_property
+    def file_manager(self):
+        """Gestionnaire des fichiers"""
+        from src.core.modules.file_manager import FileManager
+        return FileManager(self.ui)
+
+    @cached_property
+    def streamer(self):
+        """Affichage des réponses en streaming"""
+        from src.core.streamer import ResponseStreamer
+        return ResponseStreamer(self.ui)
+
+    @cached_property
+    def git_manager(self):
+        """Gestionnaire Git, initialisé sur le répertoire courant"""
+        from src.core.modules.git_manager import GitManager
+        git_manager = GitManager(self.ui)
+        git_manager.set_repo_path(os.getcwd())
+        return git_manager
+
+    @cached_property
+    def crew_manager(self):
+        """Gestionnaire des agents CrewAI (importe crewai et langchain)"""
+        from src.core.modules.crew_manager import CrewManager
+        return CrewManager(model=self.config.DEFAULT_MODEL)
+
+    @cached_property
+    def _request_defaults(self):
+        """Modèle, tokens max et température utilisés pour les questions directes"""
+        return self.config.DEFAULT_MODEL, self.config.DEFAULT_MAX_TOKENS, self.config.DEFAULT_TEMPERATURE
+
+    @property
+    def code_analysis_available(self) -> bool:
+        """Indique si tree-sitter est installé, sans l'importer"""
+        if AylaCli._code_analysis_available is None:
+            AylaCli._code_analysis_available = importlib.util.find_spec("tree_sitter") is not None
+        return AylaCli._code_analysis_available
 
     def _get_api_key(self, args) -> str:
         """Obtient la clé API et l'enregistre si nécessaire"""
@@ -92,43 +133,55 @@ class AylaCli:
 
     async def send_question_to_claude(self, question):
         """Envoie une question à Claude et retourne la réponse."""
+        model, max_tokens, temperature = self._request_defaults
         try:
             history = [{"role": "user", "content": question}]
             response = await self.client.send_message(
-                self.config.DEFAULT_MODEL,
+                model,
                 history,
-                self.config.DEFAULT_MAX_TOKENS,
-                self.config.DEFAULT_TEMPERATURE
+                max_tokens,
+                temperature
             )
             return response
         except Exception as e:
             return f"Erreur lors de l'envoi de la question: {str(e)}"
 
+    async def _show_version(self):
+        """Affiche la version"""
+        self.ui.print_info(f"Ayla CLI v-{self.config.get_version()}")
+
+    async def _run_setup(self):
+        """Démarre le mode setup"""
+        setup = AylaSetupAssistant(self.config, self.ui)
+        await setup.setup()
+
+    async def _show_models(self):
+        """Affiche les modèles disponibles"""
+        self.ui.show_models_info(self.config.AVAILABLE_MODELS)
+
+    async def _show_conversations(self):
+        """Liste les conversations"""
+        conversations = self.conv_manager.list_conversations()
+        self.ui.show_conversations_list(conversations)
+
     async def run(self):
         """Point d'entrée principal de l'application"""
         args = self.parser.parse_args()
 
-        # Afficher la version et quitter
-        if args.version:
-            self.ui.print_info(f"Ayla CLI v-{self.config.get('version', 'BETA-1.0.0')}")
-            return
-
-        # Démarrer le mode setup
-        if args.setup:
-            setup = AylaSetupAssistant(self.config, self.ui)
-            await setup.setup()
-            return
+        # Commandes utilitaires, traitées avant l'obtention de la clé API
+        for option, method_name in self._UTILITY_COMMANDS:
+            if getattr(args, option):
+                await getattr(self, method_name)()
+                return
 
-        # Afficher les modèles disponibles
-        if args.models:
-            self.ui.show_models_info(self.config.AVAILABLE_MODELS)
-            return
+        argd = vars(args)
 
-        # Lister les conversations
-        if args.list:
-            conversations = self.conv_manager.list_conversations()
-            self.ui.show_conversations_list(conversations)
-            return
+        # Déterminer la commande à exécuter (Git prioritaire, puis analyses par ordre)
+        if any(argd.get(cmd) for cmd in _GIT_COMMANDS):
+            command = 'git'
+        else:
+            command = next((cmd for cmd in _ANALYSIS_COMMANDS if argd.get(cmd)), None)
+        is_git = command == 'git'
 
         # Récupérer la clé API
         api_key = self._get_api_key(args)
@@ -136,6 +189,7 @@ class AylaCli:
             return
 
         # Initialiser le client avec la clé API
+        from src.services.client import AnthropicClient
         self.client = AnthropicClient(api_key)
 
         # Continuer la dernière conversation si demandée
@@ -147,91 +201,39 @@ class AylaCli:
             else:
                 self.ui.print_warning("Aucune conversation précédente trouvée.")
 
-        git_commands = [
-            'git_commit', 'git_branch', 'git_analyze', 'git_diff_analyze',
-            'git_conventional_commit', 'git_create_branch', 'git_commit_and_push',
-            'git_stash', 'git_stash_apply', 'git_merge', 'git_merge_squash',
-            'git_log', 'git_visualize', 'git_conflict_assist', 'git_retrospective'
-        ]
-
-        has_git_command = any(hasattr(args, cmd) and getattr(args, cmd) for cmd in git_commands)
-        if has_git_command:
-            process_git = ProcessGitHandler(self.config,
-                                            self.client,
-                                            self.ui,
-                                            api_key,
-                                            self.git_manager)
-            await process_git.process(args)
-            return
-
-        # Vérifier si les fonctionnalités d'analyse sont disponibles
-        if not self.code_analysis_available:
-            if hasattr(args, 'analyze') or hasattr(args, 'document') or \
-               hasattr(args, 'project') or hasattr(args, 'patterns_analyze') or \
-               hasattr(args, 'project_patterns'):
+        if command and not is_git:
+            # Vérifier si les fonctionnalités d'analyse sont disponibles
+            if not self.code_analysis_available:
                 self.ui.print_error(
                     "Les fonctionnalités d'analyse de code ne sont pas disponibles. "
                     "Veuillez installer tree-sitter pour utiliser ces fonctionnalités."
                 )
                 return
-        else:
-            self.code_analyzer = CodeAnalyzer(self.ui.console)
-            self.pattern_analyzer = PatternAnalyzer(self.ui.console)
-
-        # Choisir l'action en fonction des arguments
-        if hasattr(args, 'analyze') and args.analyze:
-            # Analyser un fichier de code
-            analyze = CodeAnalyzerHandler(self.config,
-                                          self.client,
-                                          self.ui,
-                                          api_key,
-                                          self.crew_manager)
-            await analyze.process(args)
-
-        elif hasattr(args, 'document') and args.document:
-            # Générer de la documentation
-            generate = DocumentationGeneratorHandler(self.config,
-                                                     self.client,
-                                                     self.ui,
-                                                     api_key,
-                                                     self.crew_manager,
-                                                     self.code_analysis_available)
-            await generate.process(args)
-
-        elif hasattr(args, 'project') and args.project:
-            # Analyser un projet entier
-            analyze_project = AnalyzeProjectHandler(self.config,
-                                                    self.client,
-                                                    self.ui,
-                                                    api_key)
-            await analyze_project.process(args)
-
-        elif hasattr(args, 'patterns_analyze') and args.patterns_analyze:
-            # Analyser les design patterns dans un fichier
-            analyze_patterns = AnalyzePatterns(self.config,
-                                                self.client,
-                                                self.ui,
-                                                api_key,
-                                                self.crew_manager,
-                                                self.code_analysis_available,
-                                                self.pattern_analyzer)
-            await analyze_patterns.process(args)
-
-        elif hasattr(args, 'project_patterns') and args.project_patterns:
-            # Analyser les design patterns dans un projet
-            analyze_project_patterns = AnalyzeProjectPatterns(self.config,
-                                                              self.client,
-                                                              self.ui,
-                                                              api_key,
-                                                              self.code_analysis_available,
-                                                              self.pattern_analyzer)
-            await analyze_project_patterns.process(args)
 
-        else:
-            # Traiter une requête standard
-            process_request = ProcessRequest(self.client,
-                                             self.ui,
-                                             self.file_manager,
-                                             self.conv_manager,
-                                             self.streamer)
-            await process_request.process_request(args, api_key)
+            # Seules les analyses de patterns partagent un analyseur ; les autres handlers créent le leur
+            if command in _PATTERN_COMMANDS:
+                from src.core.modules.code_analysis import PatternAnalyzer
+                self.pattern_analyzer = PatternAnalyzer(self.ui.console)
+
+        if command:
+            ctx = HandlerContext(
+                config=self.config,
+                client=self.client,
+                ui=self.ui,
+                api_key=api_key,
+                crew_manager=self.crew_manager if command in _CREW_COMMANDS else None,
+                git_manager=self.git_manager if is_git else None,
+                code_analysis_available=self.code_analysis_available,
+                pattern_analyzer=self.pattern_analyzer
+            )
+            await _load_handler(command)(ctx).process(args)
+            return
+
+        # Traiter une requête standard
+        from src.services.process_request import ProcessRequest
+        process_request = ProcessRequest(self.client,
+                                         self.ui,
+                                         self.file_manager,
+                                         self.conv_manager,
+                                         self.streamer)
+        await process_request.process_request(args, api_key)
@@ -101,6 +101,7 @@ class AylaConfig:
     DEFAULT_MODEL = "claude-3-7-sonnet-20250219"
     DEFAULT_MAX_TOKENS = 4000
     DEFAULT_TEMPERATURE = 0.7
+    DEFAULT_VERSION = "BETA-1.0.0"
 
     def __init__(self):
         """Initialise la configuration"""
@@ -168,6 +169,10 @@ class AylaConfig:
 
         return ""  # Empty string if not found
 
+    def get_version(self) -> str:
+        """Récupère la version de l'application"""
+        return self.get("version", self.DEFAULT_VERSION)
+
     def get_model(self) -> str:
         """Récupère le modèle à utiliser"""
         return self.get("default_model", self.DEFAULT_MODEL)
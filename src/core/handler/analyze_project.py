@@ -5,6 +5,10 @@ from src.core.handler.base_handler import BaseHandler
 
 class AnalyzeProjectHandler(BaseHandler):
 
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.crew_manager = ctx.crew_manager
+
     async def process(self, args):
         """Analyse un projet entier"""
         if not args.project:
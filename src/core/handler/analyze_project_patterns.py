@@ -7,10 +7,10 @@ from src.services.client import AnthropicClient
 
 class AnalyzeProjectPatterns(BaseHandler):
 
-    def __init__(self, config, client, ui, api_key, code_analysis_available, pattern_analyzer):
-        super().__init__(config, client, ui, api_key)
-        self.code_analysis_available = code_analysis_available
-        self.pattern_analyzer = pattern_analyzer
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.code_analysis_available = ctx.code_analysis_available
+        self.pattern_analyzer = ctx.pattern_analyzer
 
     async def process(self, args):
         """Analyse les design patterns dans un projet entier"""
@@ -1,12 +1,28 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class HandlerContext:
+    """Dépendances partagées par les handlers, construites une seule fois par exécution"""
+    config: Any
+    client: Any
+    ui: Any
+    api_key: str
+    crew_manager: Any = None
+    git_manager: Any = None
+    code_analysis_available: bool = False
+    pattern_analyzer: Any = None
+
 
 class BaseHandler:
 
-    def __init__(self, config, client, ui, api_key):
-        self.client = client
-        self.ui = ui
-        self.api_key = api_key
-        self.config = config
+    def __init__(self, ctx: HandlerContext):
+        self.client = ctx.client
+        self.ui = ctx.ui
+        self.api_key = ctx.api_key
+        self.config = ctx.config
 
 
     async def process(self, args):
-        pass
\ No newline at end of file
+        pass
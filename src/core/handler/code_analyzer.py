@@ -6,9 +6,9 @@ from src.services.client import AnthropicClient
 
 class CodeAnalyzerHandler(BaseHandler):
 
-    def __init__(self, config, client, ui, api_key, crew_manager):
-        super().__init__(config, client, ui, api_key)
-        self.crew_manager = crew_manager
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.crew_manager = ctx.crew_manager
 
     async def process(self, args):
         """Analyse un fichier de code avec Ayla"""
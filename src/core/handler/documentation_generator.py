@@ -7,10 +7,10 @@ from src.services.client import AnthropicClient
 
 class DocumentationGeneratorHandler(BaseHandler):
 
-    def __init__(self, config, client, ui, api_key, crew_manager, code_analysis_available):
-        super().__init__(config, client, ui, api_key)
-        self.crew_manager = crew_manager
-        self.code_analysis_available = code_analysis_available
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.crew_manager = ctx.crew_manager
+        self.code_analysis_available = ctx.code_analysis_available
 
     async def process(self, args):
         """Génère de la documentation pour un fichier de code avec Ayla"""
@@ -1,5 +1,7 @@
+import heapq
 import os
 import subprocess
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 import re
 import time
@@ -9,6 +11,19 @@ from rich.panel import Panel
 
 from src.core.ui import UI
 
+# Couleurs d'affichage des niveaux de risque et des catégories de commits
+_RISK_COLORS = {
+    "low": "green",
+    "medium": "yellow",
+    "high": "red"
+}
+_CATEGORY_COLORS = {
+    "fix": "red",
+    "feature": "green",
+    "refactor": "blue",
+    "chore": "yellow"
+}
+
 
 class GitManager:
     """Gestionnaire intelligent de versionnage Git"""
@@ -1420,11 +1435,11 @@ Voici le diff :
 
                 retrospective["file_stats"] = {
                     "files_changed": len(file_stats),
-                    "most_changed_files": sorted(
+                    "most_changed_files": heapq.nlargest(
+                        5,
                         file_stats,
-                        key=lambda x: x["changes"],
-                        reverse=True
-                    )[:5],  # Top 5 des fichiers les plus modifiés
+                        key=itemgetter("changes")
+                    ),  # Top 5 des fichiers les plus modifiés
                     "summary": summary_line
                 }
 
@@ -1984,12 +1999,14 @@ Réponds avec une liste concise de 3-5 insights importants.
         return "\n".join(sections)
 
     def display_git_analysis(self, analysis, type = None):
-        if type == 'diff':
-            self._display_git_diff_analysis(analysis)
-        elif type == 'retro':
-            self._display_git_retrospective(analysis)
-        else:
-            self._display_git_analysis(analysis)
+        # La console Rich met la sortie en tampon : le rapport est écrit en une fois
+        with self.ui.console:
+            if type == 'diff':
+                self._display_git_diff_analysis(analysis)
+            elif type == 'retro':
+                self._display_git_retrospective(analysis)
+            else:
+                self._display_git_analysis(analysis)
 
     def _display_git_analysis(self, analysis):
         # Vérifier s'il y a une erreur
@@ -1997,129 +2014,127 @@ Réponds avec une liste concise de 3-5 insights importants.
             self.ui.print_error(analysis["error"])
             return True
 
-        # Afficher les informations générales
-        self.ui.print_info("\n=== Informations Générales ===")
+        # Construire le rapport complet puis l'afficher en un seul appel à Rich
         info = analysis["general_info"]
-        self.ui.print_info(f"Branche actuelle : {info['current_branch']}")
-        self.ui.print_info(f"Nombre total de commits : {info['total_commits']}")
-        self.ui.print_info(f"Taille du dépôt : {info['repository_size']}")
-        self.ui.print_info(f"Date de création : {info['creation_date']}")
+        lines = [
+            "\n=== Informations Générales ===",
+            f"Branche actuelle : {info['current_branch']}",
+            f"Nombre total de commits : {info['total_commits']}",
+            f"Taille du dépôt : {info['repository_size']}",
+            f"Date de création : {info['creation_date']}",
+        ]
 
-        # Afficher l'activité
-        self.ui.print_info("\n=== Activité ===")
+        # Activité
         activity = analysis["activity"]
-        self.ui.print_info("Fréquence des commits :")
-        for period, count in activity["commit_frequency"].items():
-            self.ui.print_info(f"- {period} : {count} commits")
+        lines.append("\n=== Activité ===")
+        lines.append("Fréquence des commits :")
+        lines.extend(
+            f"- {period} : {count} commits"
+            for period, count in activity["commit_frequency"].items()
+        )
 
-        # Afficher les branches
-        self.ui.print_info("\n=== Branches ===")
+        # Branches
         branches = analysis["branches"]
-        self.ui.print_info(f"Nombre total de branches : {branches['total_count']}")
-        self.ui.print_info(f"Branches actives : {len(branches['active_branches'])}")
-        self.ui.print_info(f"Branches fusionnées : {len(branches['merged_branches'])}")
+        lines.append("\n=== Branches ===")
+        lines.append(f"Nombre total de branches : {branches['total_count']}")
+        lines.append(f"Branches actives : {len(branches['active_branches'])}")
+        lines.append(f"Branches fusionnées : {len(branches['merged_branches'])}")
 
-        # Afficher les contributeurs
-        self.ui.print_info("\n=== Contributeurs ===")
+        # Contributeurs
         contributors = analysis["contributors"]
-        self.ui.print_info(f"Nombre total : {contributors['total_count']}")
+        lines.append("\n=== Contributeurs ===")
+        lines.append(f"Nombre total : {contributors['total_count']}")
         if contributors['top_contributors']:
-            self.ui.print_info("Top contributeurs :")
-            for contrib in contributors['top_contributors'][:3]:
-                self.ui.print_info(f"- {contrib['name']} : {contrib['commits']} commits")
-
-        # Afficher la santé du code
-        self.ui.print_info("\n=== Santé du Code ===")
-        health = analysis["code_health"]
-        self.ui.print_info("Qualité des commits :")
-        quality = health["commit_quality"]
-        self.ui.print_info(f"- Messages descriptifs : {quality['descriptive_messages']}")
-        self.ui.print_info(f"- Commits conventionnels : {quality['conventional_commits']}")
-
-        # Afficher les insights IA
-        self.ui.print_info("\n=== Insights IA ===")
-        for insight in analysis["insights"]:
-            self.ui.print_info(f"- {insight}")
+            lines.append("Top contributeurs :")
+            lines.extend(
+                f"- {contrib['name']} : {contrib['commits']} commits"
+                for contrib in contributors['top_contributors'][:3]
+            )
+
+        # Santé du code
+        quality = analysis["code_health"]["commit_quality"]
+        lines.append("\n=== Santé du Code ===")
+        lines.append("Qualité des commits :")
+        lines.append(f"- Messages descriptifs : {quality['descriptive_messages']}")
+        lines.append(f"- Commits conventionnels : {quality['conventional_commits']}")
+
+        # Insights IA
+        lines.append("\n=== Insights IA ===")
+        lines.extend(f"- {insight}" for insight in analysis["insights"])
+
+        self.ui.print_info("\n".join(lines))
 
     def _display_git_diff_analysis(self, analysis: Dict[str, Any]) -> None:
         """Affiche l'analyse Git de manière formatée"""
-        # Afficher les changements par statut
-        self.ui.print_info("\n[bold cyan]=== État des Fichiers ===[/bold cyan]")
+        # Hors d'un dépôt Git : analyze_changes a déjà affiché l'avertissement
+        if not self.is_git_repo:
+            return
+
+        # Copie de travail propre : rien à détailler
+        if not (analysis["staged_changes"] or analysis["unstaged_changes"]
+                or analysis["untracked_files"]):
+            self.ui.print_info("Rien à valider, la copie de travail est propre")
+            return
 
-        # Créer des sections pour chaque type de changement
-        staged_content = ""
+        # Chaque section est un panneau dont le titre tient lieu d'en-tête
+        console = self.ui.console
+
+        # Changements par statut
+        status_content = []
         if analysis["staged_changes"]:
-            staged_content = "\n".join(
+            status_content.append("[green]Fichiers indexés[/green]")
+            status_content.extend(
                 f"[green]+ {file[0]} ({file[1]})[/green]"
                 for file in analysis["staged_changes"]
             )
 
-        unstaged_content = ""
         if analysis["unstaged_changes"]:
-            unstaged_content = "\n".join(
+            if status_content:
+                status_content.append("")
+            status_content.append("[yellow]Fichiers modifiés non indexés[/yellow]")
+            status_content.extend(
                 f"[yellow]* {file[0]} ({file[1]})[/yellow]"
                 for file in analysis["unstaged_changes"]
             )
 
-        untracked_content = ""
         if analysis["untracked_files"]:
-            untracked_content = "\n".join(
+            if status_content:
+                status_content.append("")
+            status_content.append("[dim]Fichiers non suivis[/dim]")
+            status_content.extend(
                 f"[dim]? {file}[/dim]"
                 for file in analysis["untracked_files"]
             )
 
-        # Afficher les sections dans des panels
-        if staged_content:
-            self.ui.print_info(Panel(
-                staged_content,
-                title="[green]Fichiers indexés[/green]",
-                border_style="green"
-            ).renderable)
-
-        if unstaged_content:
-            self.ui.print_info(Panel(
-                unstaged_content,
-                title="[yellow]Fichiers modifiés non indexés[/yellow]",
-                border_style="yellow"
-            ).renderable)
-
-        if untracked_content:
-            self.ui.print_info(Panel(
-                untracked_content,
-                title="[dim]Fichiers non suivis[/dim]",
-                border_style="dim"
-            ).renderable)
-
-        # Afficher les détails par fichier
-        self.ui.print_info("\n[bold cyan]=== Détails par Fichier ===[/bold cyan]")
-        file_details = []
-        for file_path, details in analysis["file_details"].items():
-            total_changes = details["added"] + details["deleted"]
-            file_details.append(
-                f"[bold]{file_path}[/bold]\n"
-                f"  [green]+ {details['added']}[/green] "
-                f"[red]- {details['deleted']}[/red] "
-                f"([yellow]{total_changes} changements[/yellow])"
-            )
+        console.print(Panel(
+            "\n".join(status_content),
+            title="[bold cyan]État des Fichiers[/bold cyan]",
+            border_style="cyan"
+        ))
+
+        # Détails par fichier
+        file_details = [
+            f"[bold]{file_path}[/bold]\n"
+            f"  [green]+ {details['added']}[/green] "
+            f"[red]- {details['deleted']}[/red] "
+            f"([yellow]{details['added'] + details['deleted']} changements[/yellow])"
+            for file_path, details in analysis["file_details"].items()
+        ]
 
         if file_details:
-            self.ui.print_info(Panel(
+            console.print(Panel(
                 "\n".join(file_details),
-                title="Modifications par fichier",
+                title="[bold cyan]Détails par Fichier[/bold cyan]",
                 border_style="cyan"
-            ).renderable)
+            ))
 
-        # Afficher l'analyse d'impact
+        # Analyse d'impact
         if analysis["impact_analysis"]:
-            self.ui.print_info("\n[bold cyan]=== Analyse d'Impact ===[/bold cyan]")
+            impact_blocks = []
 
             for file_path, impact in analysis["impact_analysis"].items():
                 # Niveau de risque avec code couleur
-                risk_color = {
-                    "low": "green",
-                    "medium": "yellow",
-                    "high": "red"
-                }.get(impact["risk_level"], "white")
+                risk_color = _RISK_COLORS.get(impact["risk_level"], "white")
 
                 impact_content = [
                     f"[bold]{file_path}[/bold]",
@@ -2140,84 +2155,87 @@ Réponds avec une liste concise de 3-5 insights importants.
                         for suggestion in impact["suggestions"]
                     )
 
-                self.ui.print_info(Panel(
-                    "\n".join(impact_content),
-                    border_style="cyan"
-                ).renderable)
+                impact_blocks.append("\n".join(impact_content))
+
+            console.print(Panel(
+                "\n\n".join(impact_blocks),
+                title="[bold cyan]Analyse d'Impact[/bold cyan]",
+                border_style="cyan"
+            ))
 
     def _display_git_retrospective(self, retro: Dict[str, Any]) -> None:
         """Affiche la rétrospective Git de manière formatée"""
+        # Chaque section est un panneau dont le titre tient lieu d'en-tête
+        console = self.ui.console
+
         # Période
         period = retro["period"]
-        self.ui.print_info("\n[bold cyan]=== Période ===[/bold cyan]")
-        self.ui.print_info(Panel(
+        console.print(Panel(
             f"Du : [bold]{period['start_date']}[/bold]\n"
             f"Au : [bold]{period['end_date']}[/bold]\n"
             f"Durée : [bold]{period['days']} jours[/bold]",
+            title="[bold cyan]Période[/bold cyan]",
             border_style="cyan"
-        ).renderable)
+        ))
 
         # Résumé
         summary = retro["summary"]
-        self.ui.print_info("\n[bold cyan]=== Résumé ===[/bold cyan]")
-        self.ui.print_info(Panel(
+        console.print(Panel(
             f"Commits totaux : [bold]{summary['total_commits']}[/bold]\n"
             f"Auteurs actifs : [bold]{summary['active_authors']}[/bold]\n"
             f"Commits par jour : [bold]{summary['commits_per_day']:.2f}[/bold]",
+            title="[bold cyan]Résumé[/bold cyan]",
             border_style="cyan"
-        ).renderable)
+        ))
 
         # Auteurs
-        self.ui.print_info("\n[bold cyan]=== Contributeurs ===[/bold cyan]")
-        for author, stats in retro["authors"].items():
-            self.ui.print_info(Panel(
+        console.print(Panel(
+            "\n\n".join(
                 f"[bold]{author}[/bold]\n"
                 f"Commits : [bold]{stats['commit_count']}[/bold]\n"
                 f"Premier commit : {stats['first_commit_date']}\n"
-                f"Dernier commit : {stats['last_commit_date']}",
-                border_style="blue"
-            ).renderable)
+                f"Dernier commit : {stats['last_commit_date']}"
+                for author, stats in retro["authors"].items()
+            ),
+            title="[bold cyan]Contributeurs[/bold cyan]",
+            border_style="blue"
+        ))
 
         # Catégories de commits
-        self.ui.print_info("\n[bold cyan]=== Types de Commits ===[/bold cyan]")
-        categories = retro["categories"]
         cat_content = []
-        for cat, count in categories.items():
-            cat_color = {
-                "fix": "red",
-                "feature": "green",
-                "refactor": "blue",
-                "chore": "yellow"
-            }.get(cat, "white")
+        for cat, count in retro["categories"].items():
+            cat_color = _CATEGORY_COLORS.get(cat, "white")
             cat_content.append(
                 f"[{cat_color}]{cat}[/{cat_color}] : [bold]{count}[/bold]"
             )
-        self.ui.print_info(Panel(
+        console.print(Panel(
             "\n".join(cat_content),
+            title="[bold cyan]Types de Commits[/bold cyan]",
             border_style="cyan"
-        ).renderable)
+        ))
 
         # Statistiques des fichiers
-        self.ui.print_info("\n[bold cyan]=== Statistiques des Fichiers ===[/bold cyan]")
         file_stats = retro["file_stats"]
-        self.ui.print_info(Panel(
+        stats_content = [
             f"Fichiers modifiés : [bold]{file_stats['files_changed']}[/bold]\n\n"
-            "[bold]Fichiers les plus modifiés :[/bold]",
+            "[bold]Fichiers les plus modifiés :[/bold]"
+        ]
+        stats_content.extend(
+            f"[bold]{file['file']}[/bold]\n"
+            f"[green]+ {file['additions']}[/green] "
+            f"[red]- {file['deletions']}[/red] "
+            f"([yellow]{file['changes']} changements[/yellow])"
+            for file in file_stats["most_changed_files"][:5]
+        )
+        console.print(Panel(
+            "\n\n".join(stats_content),
+            title="[bold cyan]Statistiques des Fichiers[/bold cyan]",
             border_style="cyan"
-        ).renderable)
-
-        for file in file_stats["most_changed_files"][:5]:
-            self.ui.print_info(Panel(
-                f"[bold]{file['file']}[/bold]\n"
-                f"[green]+ {file['additions']}[/green] "
-                f"[red]- {file['deletions']}[/red] "
-                f"([yellow]{file['changes']} changements[/yellow])",
-                border_style="blue"
-            ).renderable)
+        ))
 
         # Résumé global
-        self.ui.print_info("\n[bold cyan]=== Résumé Global ===[/bold cyan]")
-        self.ui.print_info(Panel(
+        console.print(Panel(
             file_stats["summary"],
+            title="[bold cyan]Résumé Global[/bold cyan]",
             border_style="cyan"
-        ).renderable)
+        ))
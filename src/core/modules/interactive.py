@@ -39,16 +39,17 @@ class InteractiveMode:
                 # Obtenir l'entrée de l'utilisateur
                 user_input = self.ui.get_input("\n[bold cyan]Vous:[/bold cyan] ")
 
-                # Traiter les commandes spéciales
-                if user_input.lower() in ['/exit', '/quit', '/q']:
+                # Traiter les commandes spéciales (minuscules calculées une seule fois)
+                command = user_input.lower()
+                if command in ['/exit', '/quit', '/q']:
                     break
-                elif user_input.lower() in ['/help', '/?']:
+                elif command in ['/help', '/?']:
                     self.ui.show_interactive_help()
                     continue
-                elif user_input.lower() == '/history':
+                elif command == '/history':
                     self.ui.display_conversation_history(history)
                     continue
-                elif user_input.lower().startswith('/save '):
+                elif command.startswith('/save '):
                     new_id = user_input[6:].strip()
                     if new_id:
                         self.conv_manager.save_conversation_history(new_id, history)
@@ -57,15 +58,15 @@ class InteractiveMode:
                     else:
                         self.ui.print_error("Veuillez spécifier un ID valide.")
                     continue
-                elif user_input.lower() == '/clear':
+                elif command == '/clear':
                     history = []
                     self.ui.print_info("Historique de conversation effacé.")
                     continue
-                elif user_input.lower() == '/list':
+                elif command == '/list':
                     conversations = self.conv_manager.list_conversations()
                     self.ui.show_conversations_list(conversations)
                     continue
-                elif user_input.lower().startswith('/load '):
+                elif command.startswith('/load '):
                     load_id = user_input[6:].strip()
                     if load_id:
                         new_history = self.conv_manager.load_conversation_history(load_id)
@@ -1,15 +1,81 @@
 import argparse
+import importlib.util
 import os
+import subprocess
 import sys
-import textwrap
 
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
-from src.core.modules.code_analysis import ProjectAnalyzer
 from src.config.config import AylaConfig
 from src.core.ui import UI
 
+# Dépendances indispensables, installées par l'assistant si absentes
+# (rich n'y figure pas : il est importé avant que l'assistant ne puisse s'exécuter)
+REQUIRED_PACKAGES = ("anthropic",)
+
+# Exemples affichés à la fin de l'aide
+_EPILOG = """
+Exemples d'utilisation:
+  ayla "Quelle est la capitale de la France?"
+  ayla -f moncode.py "Explique ce code"
+  cat fichier.txt | ayla "Résume ce texte"
+  ayla -i                      # Mode interactif
+  ayla -c abc123               # Continuer une conversation
+  ayla --list                  # Lister les conversations
+  ayla --setup                 # Configurer l'outil
+"""
+
+# Valeurs acceptées par les options à choix (tuples : ordre conservé dans l'aide)
+ANALYSIS_TYPES = ('general', 'security', 'performance', 'style')
+ANALYSIS_CREWS = ('research', 'code_review', 'code_analysis', 'analysis')
+DOC_TYPES = ('complete', 'api', 'usage')
+DOC_FORMATS = ('markdown', 'html', 'rst')
+GIT_LOG_FORMATS = ('default', 'detailed', 'summary', 'stats', 'full')
+
+# Options des groupes ajoutés au parseur uniquement lorsqu'elles sont utilisées
+_ANALYSIS_OPTIONS = (
+    "--analyze", "--analysis-type", "--analysis-crew", "--document", "--doc-type",
+    "--doc-format", "--project", "--extensions", "--exclude-dirs", "--exclude-files",
+    "--no-default-excludes", "--output-dir", "--patterns-analyze", "--project-patterns",
+    "--pattern-output"
+)
+_STORE_TRUE = {"action": "store_true"}
+
+# Options Git : (option, aide, paramètres argparse ; None pour un simple drapeau)
+_GIT_ARGUMENTS = (
+    ("--git-commit", "Message de commit", None),
+    ("--git-branch", "Nom de branche", {}),
+    ("--git-analyze", "Analyser dépôt", None),
+    ("--git-diff-analyze", "Analyser diff", None),
+    ("--git-create-branch", "Créer branche", None),
+    ("--git-commit-and-push", "Commit et push", None),
+    ("--git-conventional-commit", "Commit conventionnel", None),
+    ("--git-stash", "Stash", {"action": "store", "nargs": "?", "const": "", "metavar": "NOM"}),
+    ("--git-stash-apply", "Appliquer stash", None),
+    ("--git-merge", "Fusionner branche", {"action": "store", "metavar": "BRANCHE"}),
+    ("--git-merge-squash", "Fusionner en squash", {"action": "store", "metavar": "BRANCHE"}),
+    ("--git-log", "Log amélioré", None),
+    ("--git-log-format", "Format du log", {"choices": GIT_LOG_FORMATS, "default": "stats"}),
+    ("--git-log-count", "Nombre de commits", {"type": int, "default": 10}),
+    ("--git-log-graph", "Log avec graphe", None),
+    ("--git-visualize", "Visualisation", None),
+    ("--git-conflict-assist", "Aide conflits", None),
+    ("--git-retrospective", "Rétrospective",
+     {"action": "store", "type": int, "nargs": "?", "const": 14, "metavar": "JOURS"}),
+)
+_GIT_OPTIONS = tuple(flag for flag, _, _ in _GIT_ARGUMENTS)
+
+
+def _uses_options(argv, options) -> bool:
+    """Indique si argv contient l'une des options (ou une abréviation acceptée par argparse)"""
+    for arg in argv:
+        if arg.startswith("--") and len(arg) > 2:
+            name = arg.split("=", 1)[0]
+            if any(option.startswith(name) for option in options):
+                return True
+    return False
+
 
 class AylaSetupAssistant:
     """Assistant de configuration pour Ayla CLI"""
@@ -19,6 +85,18 @@ class AylaSetupAssistant:
         self.config = config
         self.ui = ui
 
+    def _ensure_dependencies(self):
+        """Installe les dépendances requises manquantes"""
+        missing = [pkg for pkg in REQUIRED_PACKAGES if importlib.util.find_spec(pkg) is None]
+        if not missing:
+            return
+
+        self.ui.print_info(f"Installation des dépendances requises: {', '.join(missing)}...")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+        except subprocess.CalledProcessError as e:
+            self.ui.print_error(f"Erreur lors de l'installation des dépendances: {str(e)}")
+
     def _configure_parameters(self):
         """Configure les paramètres par défaut"""
         self.ui.console.print("\n[bold]3. Configuration des paramètres par défaut[/bold]")
@@ -96,6 +174,8 @@ class AylaSetupAssistant:
 
     def _setup_project_analyzer_config(self):
         """Configure les options d'analyse de projet"""
+        from src.core.modules.code_analysis import ProjectAnalyzer
+
         self.ui.console.print("\n[bold]Configuration de l'analyseur de projet[/bold]")
 
         config_data = self.config.load_config()
@@ -128,6 +208,8 @@ class AylaSetupAssistant:
 
     async def setup(self):
         """Lance l'assistant de configuration"""
+        self._ensure_dependencies()
+
         self.ui.console.print(Panel.fit(
             "[bold]Assistant de configuration Ayla CLI[/bold]\n\n"
             "Cet assistant va vous aider à configurer l'outil pour une utilisation optimale.",
@@ -193,22 +275,16 @@ class AylaSetupAssistant:
         # self._setup_alias()
 
     @staticmethod
-    def setup_argparse(config):
-        """Configure le parseur d'arguments"""
+    def setup_argparse(config, argv=None):
+        """Configure le parseur d'arguments pour la ligne de commande argv (sys.argv par défaut)"""
+        if argv is None:
+            argv = sys.argv[1:]
+
         desc = "Ayla CLI - Interface en ligne de commande pour une IA"
         parser = argparse.ArgumentParser(
             description=desc,
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=textwrap.dedent("""
-            Exemples d'utilisation:
-              ayla "Quelle est la capitale de la France?"
-              ayla -f moncode.py "Explique ce code"
-              cat fichier.txt | ayla "Résume ce texte"
-              ayla -i                      # Mode interactif
-              ayla -c abc123               # Continuer une conversation
-              ayla --list                  # Lister les conversations
-              ayla --setup                 # Configurer l'outil
-            """)
+            epilog=_EPILOG
         )
 
         # Arguments principaux
@@ -294,6 +370,43 @@ class AylaSetupAssistant:
             help="Continuer conversation"
         )
 
+        # Options d'analyse, ajoutées seulement si la ligne de commande les utilise (ou pour l'aide)
+        with_all = any(arg in ("-h", "--help") for arg in argv)
+        if with_all or _uses_options(argv, _ANALYSIS_OPTIONS):
+            AylaSetupAssistant._add_analysis_args(parser)
+
+        # Commandes utilitaires
+        util_group = parser.add_argument_group('Utilitaires')
+        util_group.add_argument(
+            "--list", "-l",
+            action="store_true",
+            help="Lister conversations"
+        )
+        util_group.add_argument(
+            "--setup",
+            action="store_true",
+            help="Configuration"
+        )
+        util_group.add_argument(
+            "--models",
+            action="store_true",
+            help="Liste des modèles"
+        )
+        util_group.add_argument(
+            "--version", "-v",
+            action="store_true",
+            help="Version"
+        )
+
+        # Options Git, même principe
+        if with_all or _uses_options(argv, _GIT_OPTIONS):
+            AylaSetupAssistant._add_git_args(parser)
+
+        return parser
+
+    @staticmethod
+    def _add_analysis_args(parser):
+        """Ajoute les options d'analyse de code et de patterns"""
         # Options pour l'analyse de code
         code_group = parser.add_argument_group('Analyse de code')
         code_group.add_argument(
@@ -303,13 +416,13 @@ class AylaSetupAssistant:
         )
         code_group.add_argument(
             "--analysis-type",
-            choices=['general', 'security', 'performance', 'style'],
+            choices=ANALYSIS_TYPES,
             default='general',
             help="Type d'analyse"
         )
         code_group.add_argument(
             "--analysis-crew",
-            choices=['research', 'code_review', 'code_analysis', 'analysis'],
+            choices=ANALYSIS_CREWS,
             default=None,
             help="Analyse avancer avec des agents"
         )
@@ -320,13 +433,13 @@ class AylaSetupAssistant:
         )
         code_group.add_argument(
             "--doc-type",
-            choices=['complete', 'api', 'usage'],
+            choices=DOC_TYPES,
             default='complete',
             help="Type de doc"
         )
         code_group.add_argument(
             "--doc-format",
-            choices=['markdown', 'html', 'rst'],
+            choices=DOC_FORMATS,
             default='markdown',
             help="Format de doc"
         )
@@ -374,131 +487,9 @@ class AylaSetupAssistant:
             help="Fichier de sortie pour l'analyse"
         )
 
-        # Commandes utilitaires
-        util_group = parser.add_argument_group('Utilitaires')
-        util_group.add_argument(
-            "--list", "-l",
-            action="store_true",
-            help="Lister conversations"
-        )
-        util_group.add_argument(
-            "--setup",
-            action="store_true",
-            help="Configuration"
-        )
-        util_group.add_argument(
-            "--models",
-            action="store_true",
-            help="Liste des modèles"
-        )
-        util_group.add_argument(
-            "--version", "-v",
-            action="store_true",
-            help="Version"
-        )
-
-        # Options Git
+    @staticmethod
+    def _add_git_args(parser):
+        """Ajoute les options Git"""
         git_group = parser.add_argument_group('Git')
-        git_group.add_argument(
-            "--git-commit",
-            action="store_true",
-            help="Message de commit"
-        )
-        git_group.add_argument(
-            "--git-branch",
-            help="Nom de branche"
-        )
-        git_group.add_argument(
-            "--git-analyze",
-            action="store_true",
-            help="Analyser dépôt"
-        )
-        git_group.add_argument(
-            "--git-diff-analyze",
-            action="store_true",
-            help="Analyser diff"
-        )
-        git_group.add_argument(
-            "--git-create-branch",
-            action="store_true",
-            help="Créer branche"
-        )
-        git_group.add_argument(
-            "--git-commit-and-push",
-            action="store_true",
-            help="Commit et push"
-        )
-        git_group.add_argument(
-            "--git-conventional-commit",
-            action="store_true",
-            help="Commit conventionnel"
-        )
-        git_group.add_argument(
-            "--git-stash",
-            action="store",
-            nargs="?",
-            const="",
-            metavar="NOM",
-            help="Stash"
-        )
-        git_group.add_argument(
-            "--git-stash-apply",
-            action="store_true",
-            help="Appliquer stash"
-        )
-        git_group.add_argument(
-            "--git-merge",
-            action="store",
-            metavar="BRANCHE",
-            help="Fusionner branche"
-        )
-        git_group.add_argument(
-            "--git-merge-squash",
-            action="store",
-            metavar="BRANCHE",
-            help="Fusionner en squash"
-        )
-        git_group.add_argument(
-            "--git-log",
-            action="store_true",
-            help="Log amélioré"
-        )
-        git_group.add_argument(
-            "--git-log-format",
-            choices=["default", "detailed", "summary", "stats", "full"],
-            default="stats",
-            help="Format du log"
-        )
-        git_group.add_argument(
-            "--git-log-count",
-            type=int,
-            default=10,
-            help="Nombre de commits"
-        )
-        git_group.add_argument(
-            "--git-log-graph",
-            action="store_true",
-            help="Log avec graphe"
-        )
-        git_group.add_argument(
-            "--git-visualize",
-            action="store_true",
-            help="Visualisation"
-        )
-        git_group.add_argument(
-            "--git-conflict-assist",
-            action="store_true",
-            help="Aide conflits"
-        )
-        git_group.add_argument(
-            "--git-retrospective",
-            action="store",
-            type=int,
-            nargs="?",
-            const=14,
-            metavar="JOURS",
-            help="Rétrospective"
-        )
-
-        return parser
-
+        for flag, help_text, kwargs in _GIT_ARGUMENTS:
+            git_group.add_argument(flag, help=help_text, **(_STORE_TRUE if kwargs is None else kwargs))
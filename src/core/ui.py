@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from typing import Dict, Tuple, List
 
 
@@ -7,9 +8,46 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
+from rich.text import Text
 from rich.theme import Theme
 
 
+_INTERACTIVE_HELP_TEXT = """
+        [bold]Commandes disponibles en mode interactif:[/bold]
+
+        /help, /?    : Affiche cette aide
+        /exit, /quit, /q : Quitte le mode interactif
+        /history     : Affiche l'historique de la conversation actuelle
+        /clear       : Efface l'historique de la conversation actuelle
+        /save [id]   : Sauvegarde la conversation avec un nouvel ID
+        /list        : Liste toutes les conversations sauvegardées
+        /load [id]   : Charge une conversation existante
+
+        [italic]Appuyez sur Ctrl+C pour quitter à tout moment.[/italic]
+        """
+
+
+# Couleur associée à chaque type de commit conventionnel
+_COMMIT_TYPE_COLORS = {
+    'feat': 'green',
+    'fix': 'red',
+    'docs': 'blue',
+    'style': 'magenta',
+    'refactor': 'cyan',
+    'perf': 'yellow',
+    'test': 'green3',
+    'build': 'white',
+    'ci': 'white',
+    'chore': 'dim white'
+}
+
+
+@lru_cache(maxsize=1)
+def _interactive_help_panel() -> Panel:
+    """Panneau d'aide du mode interactif, dont le balisage n'est analysé qu'une fois"""
+    return Panel(Text.from_markup(_INTERACTIVE_HELP_TEXT), title="Aide", border_style="blue")
+
+
 class UI:
     """Gestion de l'interface utilisateur"""
 
@@ -177,26 +215,14 @@ class UI:
 
     def show_interactive_help(self):
         """Affiche l'aide pour le mode interactif"""
-        help_text = """
-        [bold]Commandes disponibles en mode interactif:[/bold]
-
-        /help, /?    : Affiche cette aide
-        /exit, /quit, /q : Quitte le mode interactif
-        /history     : Affiche l'historique de la conversation actuelle
-        /clear       : Efface l'historique de la conversation actuelle
-        /save [id]   : Sauvegarde la conversation avec un nouvel ID
-        /list        : Liste toutes les conversations sauvegardées
-        /load [id]   : Charge une conversation existante
-
-        [italic]Appuyez sur Ctrl+C pour quitter à tout moment.[/italic]
-        """
-        self.console.print(Panel(help_text, title="Aide", border_style="blue"))
+        self.console.print(_interactive_help_panel())
 
     def create_progress(self, message: str = "Ayla réfléchit...", transient: bool = True) -> Progress:
         """Crée une barre de progression"""
         progress = Progress(
             SpinnerColumn(),
             TextColumn(f"[info]{message}[/info]"),
+            console=self.console,
             transient=transient,
         )
         return progress
@@ -208,18 +234,7 @@ class UI:
 
         # Afficher le type avec une couleur spécifique
         commit_type = commit_data.get('type', 'chore')
-        type_color = {
-            'feat': 'green',
-            'fix': 'red',
-            'docs': 'blue',
-            'style': 'magenta',
-            'refactor': 'cyan',
-            'perf': 'yellow',
-            'test': 'green3',
-            'build': 'white',
-            'ci': 'white',
-            'chore': 'dim white'
-        }.get(commit_type, 'white')
+        type_color = _COMMIT_TYPE_COLORS.get(commit_type, 'white')
 
         self.console.print(f"\n[bold cyan]Type:[/bold cyan] [{type_color}]{commit_type}[/{type_color}]")
 
@@ -1,9 +1,10 @@
-import time
+import asyncio
 import random
 import logging
 
 from anthropic import (
     Anthropic, 
+    AsyncAnthropic,
     RateLimitError, 
     APIConnectionError, 
     APIStatusError, 
@@ -27,6 +28,8 @@ class AnthropicClient:
         """
         self.cache = ResponseCache('~/.ayla-cli/cache')
         self.client = self._create_client(api_key)
+        # Client asynchrone : annuler la tâche interrompt la requête HTTP en cours
+        self.async_client = AsyncAnthropic(api_key=api_key)
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.logger = logger or logging.getLogger(__name__)
@@ -56,8 +59,7 @@ class AnthropicClient:
 
         while retry_count <= self.max_retries:
             try:
-                # Procéder avec l'appel API normal
-                response = self.client.messages.create(
+                response = await self.async_client.messages.create(
                     model=model,
                     max_tokens=max_tokens,
                     temperature=temperature,
@@ -81,7 +83,7 @@ class AnthropicClient:
                     self.logger.warning(
                         f"Limite de taux dépassée. Nouvelle tentative dans {delay:.2f} secondes..."
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 else:
                     raise
             except APIConnectionError as e:
@@ -94,7 +96,7 @@ class AnthropicClient:
                     self.logger.warning(
                         f"Erreur de connexion. Nouvelle tentative dans {delay:.2f} secondes..."
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 else:
                     raise
             except (APIStatusError, APIError) as e: